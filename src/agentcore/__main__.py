@@ -2,16 +2,11 @@
 from __future__ import annotations
 
 import argparse
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
 
-from .config import AgentCoreConfig, GuardrailConfig, KnowledgeBaseConfig, PromptTemplateConfig
-from .deployment import AgentCoreDeployer, create_knowledge_base
 
-
-def _parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="AgentCore deployment utilities")
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    kb = subparsers.add_parser("create-knowledge-base", help="Create a Bedrock knowledge base")
+def _add_knowledge_base_args(kb: argparse.ArgumentParser) -> None:
     kb.add_argument("--region", required=True)
     kb.add_argument("--name", required=True)
     kb.add_argument("--description", default="Strands knowledge base")
@@ -19,7 +14,8 @@ def _parse_args() -> argparse.Namespace:
     kb.add_argument("--role-arn", required=True)
     kb.add_argument("--s3-uri", required=True)
 
-    deploy = subparsers.add_parser("deploy-agent", help="Deploy Bedrock AgentCore")
+
+def _add_deploy_args(deploy: argparse.ArgumentParser) -> None:
     deploy.add_argument("--region", required=True)
     deploy.add_argument("--agent-name", required=True)
     deploy.add_argument("--instruction", required=True)
@@ -31,12 +27,34 @@ def _parse_args() -> argparse.Namespace:
     deploy.add_argument("--guardrail-arn", required=True)
     deploy.add_argument("--guardrail-version", default=None)
 
-    return parser.parse_args()
+
+_SUBCOMMANDS: Dict[str, Tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "create-knowledge-base": ("Create a Bedrock knowledge base", _add_knowledge_base_args),
+    "deploy-agent": ("Deploy Bedrock AgentCore", _add_deploy_args),
+}
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(description="AgentCore deployment utilities")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Only the selected subcommand needs its arguments registered.
+    selected = next((arg for arg in argv if arg in _SUBCOMMANDS), None)
+    for name, (help_text, add_arguments) in _SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == selected:
+            add_arguments(subparser)
+
+    return parser.parse_args(argv)
 
 
 def main() -> None:
     args = _parse_args()
+    # Deployment helpers import boto3, so they are only loaded once a command runs.
     if args.command == "create-knowledge-base":
+        from .deployment import create_knowledge_base
+
         response = create_knowledge_base(
             region_name=args.region,
             name=args.name,
@@ -49,6 +67,9 @@ def main() -> None:
         return
 
     if args.command == "deploy-agent":
+        from .config import AgentCoreConfig, GuardrailConfig, KnowledgeBaseConfig, PromptTemplateConfig
+        from .deployment import AgentCoreDeployer
+
         config = AgentCoreConfig(
             bedrock_agent_id="",
             bedrock_agent_alias_id="",
@@ -1,13 +1,23 @@
 """Factory classes for AWS clients used by the Strands AgentCore runtime."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Protocol
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Protocol
 
 import boto3
+from botocore.config import Config
 
 from .config import AgentCoreConfig
 
+SHARED_CLIENT_CONFIG = Config(
+    max_pool_connections=int(os.getenv("BOTOCORE_CLIENT_MAX_POOL_CONNECTIONS", "50")),
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+"""botocore settings shared by every client so concurrent calls reuse pooled connections."""
+
 
 class BedrockRuntimeProtocol(Protocol):
     """Minimal protocol for the Bedrock Runtime client."""
@@ -16,26 +26,46 @@ class BedrockRuntimeProtocol(Protocol):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BedrockClientFactory:
-    """Creates typed boto3 clients required by the agent."""
+    """Creates typed boto3 clients required by the agent.
+
+    Clients are built once per service and reused afterwards. boto3 clients
+    are thread-safe, so sharing them keeps connection pools warm across calls.
+    """
 
     region_name: str
+    _clients: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def _client(self, service_name: str):
+        client = self._clients.get(service_name)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(service_name)
+                if client is None:
+                    client = boto3.client(
+                        service_name,
+                        region_name=self.region_name,
+                        config=SHARED_CLIENT_CONFIG,
+                    )
+                    self._clients[service_name] = client
+        return client
 
     def bedrock_runtime(self) -> BedrockRuntimeProtocol:
-        return boto3.client("bedrock-runtime", region_name=self.region_name)
+        return self._client("bedrock-runtime")
 
     def bedrock_agent(self):
-        return boto3.client("bedrock-agent", region_name=self.region_name)
+        return self._client("bedrock-agent")
 
     def bedrock_agent_runtime(self):
-        return boto3.client("bedrock-agent-runtime", region_name=self.region_name)
+        return self._client("bedrock-agent-runtime")
 
     def bedrock_knowledge_base(self):
-        return boto3.client("bedrock-knowledge-base", region_name=self.region_name)
+        return self._client("bedrock-knowledge-base")
 
     def bedrock_guardrails(self):
-        return boto3.client("bedrock-guardrails", region_name=self.region_name)
+        return self._client("bedrock-guardrails")
 
 
 @dataclass(frozen=True)
@@ -44,6 +74,10 @@ class BedrockDependencyContainer:
 
     config: AgentCoreConfig
     region_name: str
+    _factory: BedrockClientFactory = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_factory", BedrockClientFactory(region_name=self.region_name))
 
     def factory(self) -> BedrockClientFactory:
-        return BedrockClientFactory(region_name=self.region_name)
+        return self._factory
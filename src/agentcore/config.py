@@ -42,6 +42,7 @@ class PromptTemplateConfig:
 
     prompt_arn: str
     version: Optional[str] = None
+    cache_ttl_seconds: float = 300.0
 
 
 @dataclass(frozen=True)
@@ -70,6 +71,7 @@ class ObservabilityConfig:
     enable_cloudwatch_metrics: bool = True
     enable_cloudwatch_logs: bool = True
     feedback_table_name: Optional[str] = None
+    feedback_epoch_millis_timestamps: bool = False
 
 
 @dataclass(frozen=True)
@@ -1,12 +1,26 @@
 """Deployment helpers for Bedrock AgentCore."""
 from __future__ import annotations
 
+import functools
+import threading
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Tuple
 
 import boto3
 
+from .bedrock_clients import SHARED_CLIENT_CONFIG
 from .config import AgentCoreConfig, KnowledgeBaseConfig, PromptTemplateConfig
+from .prompt_template_manager import get_prompt_cached
+
+_KNOWN_KNOWLEDGE_BASES: Dict[Tuple[str, str], str] = {}
+_KNOWN_KNOWLEDGE_BASES_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _client(service_name: str, region_name: str):
+    """Return a process-wide boto3 client for ``service_name`` in ``region_name``."""
+
+    return boto3.client(service_name, region_name=region_name, config=SHARED_CLIENT_CONFIG)
 
 
 @dataclass
@@ -17,23 +31,30 @@ class AgentCoreDeployer:
     region_name: str
 
     def __post_init__(self) -> None:
-        self.agent_client = boto3.client("bedrock-agent", region_name=self.region_name)
-        self.runtime_client = boto3.client("bedrock-agent-runtime", region_name=self.region_name)
-        self.kb_client = boto3.client("bedrock-knowledge-base", region_name=self.region_name)
+        self.agent_client = _client("bedrock-agent", self.region_name)
+        self.runtime_client = _client("bedrock-agent-runtime", self.region_name)
+        self.kb_client = _client("bedrock-knowledge-base", self.region_name)
 
     def ensure_knowledge_base(self, config: KnowledgeBaseConfig) -> str:
+        key = (self.region_name, config.knowledge_base_id)
+        with _KNOWN_KNOWLEDGE_BASES_LOCK:
+            knowledge_base_id = _KNOWN_KNOWLEDGE_BASES.get(key)
+        if knowledge_base_id is not None:
+            return knowledge_base_id
         try:
             response = self.kb_client.get_knowledge_base(knowledgeBaseId=config.knowledge_base_id)
-            return response["knowledgeBaseId"]
         except self.kb_client.exceptions.ResourceNotFoundException:
             raise ValueError(
                 "Knowledge base must be created ahead of deployment. Use `create_knowledge_base.py`."
             )
+        knowledge_base_id = response["knowledgeBaseId"]
+        with _KNOWN_KNOWLEDGE_BASES_LOCK:
+            _KNOWN_KNOWLEDGE_BASES[key] = knowledge_base_id
+        return knowledge_base_id
 
     def register_prompt_template(self, config: PromptTemplateConfig) -> Dict[str, str]:
-        response = self.agent_client.get_prompt(
-            promptIdentifier=config.prompt_arn,
-            promptVersion=config.version or "$LATEST",
+        response = get_prompt_cached(
+            self.agent_client, config.prompt_arn, config.version, config.cache_ttl_seconds
         )
         return {
             "promptIdentifier": response["promptArn"],
@@ -99,7 +120,7 @@ def create_knowledge_base(
 ) -> Dict:
     """Creates a Bedrock knowledge base used for RAG."""
 
-    kb_client = boto3.client("bedrock-knowledge-base", region_name=region_name)
+    kb_client = _client("bedrock-knowledge-base", region_name)
     response = kb_client.create_knowledge_base(
         name=name,
         description=description,
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from .bedrock_clients import BedrockClientFactory
@@ -10,47 +11,61 @@ from .config import GuardrailConfig
 
 @dataclass(frozen=True)
 class GuardrailApplicationResult:
-    """Represents the outcome of applying a guardrail to a text payload."""
+    """Represents the outcome of applying a guardrail to a text payload.
+
+    Unlike the managers this class keeps its ``__dict__`` (no ``slots``) because
+    ``_sanitized_output`` relies on ``cached_property`` storage.
+    """
 
     action: str
     reason: Optional[str]
     outputs: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "action", self.action.upper())
+
     @property
     def intervened(self) -> bool:
         """Return ``True`` when the guardrail blocked or redacted content."""
 
-        return self.action.upper() == "GUARDRAIL_INTERVENED"
+        return self.action == "GUARDRAIL_INTERVENED"
+
+    @cached_property
+    def _sanitized_output(self) -> str:
+        # cached_property writes to the instance ``__dict__`` directly, so it
+        # works on this frozen dataclass and joins the outputs only once.
+        joined = "".join(self.outputs)
+        return joined.strip() if joined else joined
 
     def resolved_text(self, original: str) -> str:
         """Return the guardrail-adjusted text, falling back to ``original``."""
 
-        if self.outputs:
-            sanitized = "".join(self.outputs).strip()
-            if sanitized:
-                return sanitized
-        return original
+        return self._sanitized_output or original
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GuardrailManager:
     """Provides helpers to configure and actively enforce guardrails."""
 
     client_factory: BedrockClientFactory
     config: GuardrailConfig
+    _params: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        params = {"guardrailIdentifier": self.config.guardrail_arn}
+        if self.config.guardrail_version:
+            params["guardrailVersion"] = self.config.guardrail_version
+        object.__setattr__(self, "_params", params)
 
     def runtime_parameters(self) -> Dict[str, str]:
         """Return the parameters expected by ``invoke_agent``.
 
-        Keeping the method tiny avoids the indirection of mutating request
-        dictionaries in-place and makes the service layer code easier to read.
+        The dictionary is built once from the immutable config; a copy is
+        returned so callers can merge it into request payloads freely.
         """
 
-        params = {"guardrailIdentifier": self.config.guardrail_arn}
-        if self.config.guardrail_version:
-            params["guardrailVersion"] = self.config.guardrail_version
-        return params
+        return dict(self._params)
 
     def apply_to_output(self, content: str) -> GuardrailApplicationResult:
         """Run ``ApplyGuardrail`` on generated content.
@@ -77,12 +92,13 @@ class GuardrailManager:
             outputScope="FULL",
         )
 
-        outputs: List[str] = []
-        for block in response.get("outputs", []):
-            if isinstance(block, dict):
-                text = block.get("text")
-                if isinstance(text, str) and text:
-                    outputs.append(text)
+        outputs: List[str] = [
+            text
+            for block in response.get("outputs", ())
+            if isinstance(block, dict)
+            for text in (block.get("text"),)
+            if isinstance(text, str) and text
+        ]
 
         metadata: Dict[str, Any] = {}
         coverage = response.get("guardrailCoverage")
@@ -93,7 +109,7 @@ class GuardrailManager:
             metadata["assessments"] = assessments
 
         return GuardrailApplicationResult(
-            action=response.get("action", "NONE"),
+            action=response.get("action") or "NONE",
             reason=response.get("actionReason"),
             outputs=outputs,
             metadata=metadata,
@@ -1,14 +1,19 @@
 """Knowledge base retrieval for RAG using Bedrock Knowledge Bases."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 
 from .bedrock_clients import BedrockClientFactory
 from .config import KnowledgeBaseConfig
 
+# Read-only default for missing ``content``/``document`` keys, shared across lookups.
+_EMPTY: Mapping[str, Dict] = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True)
 class KnowledgeBaseRetriever:
     """Retrieves documents from Bedrock Knowledge Bases."""
 
@@ -30,12 +35,28 @@ class KnowledgeBaseRetriever:
         )
         return response.get("retrievedResults", [])
 
+    def retrieve_many(self, queries: List[str]) -> List[List[Dict]]:
+        """Retrieve documents for several queries concurrently.
+
+        Results are returned in the same order as ``queries``. The shared
+        client is thread-safe, so the calls only contend for pooled connections.
+        """
+
+        if not queries:
+            return []
+        if len(queries) == 1:
+            return [self.retrieve(queries[0])]
+        with ThreadPoolExecutor(max_workers=min(len(queries), self.config.top_k)) as executor:
+            return list(executor.map(self.retrieve, queries))
+
+    @staticmethod
+    def _format_citation(doc: Mapping[str, str]) -> str:
+        return f"{doc.get('title', 'Document')} ({doc.get('sourceUri') or doc.get('s3Uri', '')})"
+
     @staticmethod
     def to_citations(results: List[Dict]) -> List[str]:
-        citations: List[str] = []
-        for item in results:
-            doc = item.get("content", {}).get("document", {})
-            title = doc.get("title", "Document")
-            source = doc.get("sourceUri") or doc.get("s3Uri", "")
-            citations.append(f"{title} ({source})")
-        return citations
+        format_citation = KnowledgeBaseRetriever._format_citation
+        return [
+            format_citation(item.get("content", _EMPTY).get("document", _EMPTY))
+            for item in results
+        ]
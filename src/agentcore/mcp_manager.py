@@ -1,13 +1,18 @@
 """Utilities to deploy Model Context Protocol (MCP) adapters."""
 from __future__ import annotations
 
+import re
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from .config import MCPRepositoryConfig
 
+_COMMIT_SHA = re.compile(r"^[0-9a-f]{7,40}$", re.IGNORECASE)
+
 
 @dataclass
 class MCPRepositoryInstaller:
@@ -15,21 +20,76 @@ class MCPRepositoryInstaller:
 
     repositories: Iterable[MCPRepositoryConfig]
     install_dir: Path
+    max_parallel_clones: int = 8
 
     def install(self) -> List[Path]:
-        installed_paths: List[Path] = []
         self.install_dir.mkdir(parents=True, exist_ok=True)
-        for repo in self.repositories:
-            repo_dir = self.install_dir / repo.name
-            if repo_dir.exists():
+        repositories = list(self.repositories)
+        if not repositories:
+            return []
+
+        # Clones are network bound and target independent directories.
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel_clones, len(repositories))) as executor:
+            futures = [executor.submit(self._clone, repo) for repo in repositories]
+
+        # A failed clone must not skip setup for the repositories that did
+        # clone: a retry finds their directories and would never set them up.
+        installed_paths: List[Path] = []
+        clone_error: Optional[BaseException] = None
+        for repo, future in zip(repositories, futures):
+            if future.exception() is not None:
+                clone_error = clone_error or future.exception()
+                continue
+            repo_dir = future.result()
+            if repo_dir is None:
                 continue
-            subprocess.check_call(["git", "clone", repo.git_url, str(repo_dir)])
-            subprocess.check_call(["git", "checkout", repo.revision], cwd=repo_dir)
+            # Startup commands usually install into the shared interpreter, so
+            # they run one at a time to avoid concurrent pip invocations.
             if repo.startup_command:
-                subprocess.check_call(repo.startup_command, cwd=repo_dir)
+                subprocess.run(repo.startup_command, cwd=repo_dir, check=True)
             installed_paths.append(repo_dir)
+        if clone_error is not None:
+            raise clone_error
         return installed_paths
 
+    def _clone(self, repo: MCPRepositoryConfig) -> Optional[Path]:
+        repo_dir = self.install_dir / repo.name
+        if repo_dir.exists():
+            return None
+        try:
+            subprocess.run(
+                [
+                    "git",
+                    "clone",
+                    "--depth",
+                    "1",
+                    "--branch",
+                    repo.revision,
+                    "--single-branch",
+                    repo.git_url,
+                    str(repo_dir),
+                ],
+                check=True,
+            )
+        except subprocess.CalledProcessError:
+            # A hex-looking revision may still be a branch or tag, so the shallow
+            # clone is tried first. Commits cannot be cloned by name; fetch
+            # history without blobs and check the commit out instead.
+            if not _COMMIT_SHA.match(repo.revision):
+                raise
+            shutil.rmtree(repo_dir, ignore_errors=True)
+            try:
+                subprocess.run(
+                    ["git", "clone", "--filter=blob:none", repo.git_url, str(repo_dir)],
+                    check=True,
+                )
+                subprocess.run(["git", "-C", str(repo_dir), "checkout", repo.revision], check=True)
+            except subprocess.CalledProcessError:
+                # Leave no directory behind, or a retry would skip this repository.
+                shutil.rmtree(repo_dir, ignore_errors=True)
+                raise
+        return repo_dir
+
 
 @dataclass
 class MCPBootstrapper:
@@ -1,14 +1,26 @@
 """Observability utilities for Strands AgentCore."""
 from __future__ import annotations
 
+import atexit
+import logging
+import threading
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List, Protocol
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Protocol, Sequence, Tuple
 
 import boto3
 
+from .bedrock_clients import SHARED_CLIENT_CONFIG
 from .config import AgentCoreConfig, ObservabilityConfig
 
+MetricItem = Tuple[str, float, str]
+
+# PutMetricData accepts at most 1000 MetricData entries per request.
+_MAX_METRIC_DATA_PER_CALL = 1000
+
+logger = logging.getLogger(__name__)
+
 
 class MetricSink(Protocol):
     """Interface for metric sinks."""
@@ -25,7 +37,7 @@ class CloudWatchMetricSink:
     """Sends metrics to CloudWatch."""
 
     namespace: str
-    client: any = field(default_factory=lambda: boto3.client("cloudwatch"))
+    client: any = field(default_factory=lambda: boto3.client("cloudwatch", config=SHARED_CLIENT_CONFIG))
 
     def put_metric(self, name: str, value: float, unit: str = "Count") -> None:
         self.client.put_metric_data(
@@ -33,16 +45,118 @@ class CloudWatchMetricSink:
             MetricData=[{"MetricName": name, "Value": value, "Unit": unit}],
         )
 
+    def put_metrics(self, items: Sequence[MetricItem]) -> None:
+        """Send ``(name, value, unit)`` items using as few API calls as possible."""
+
+        for start in range(0, len(items), _MAX_METRIC_DATA_PER_CALL):
+            self.client.put_metric_data(
+                Namespace=self.namespace,
+                MetricData=[
+                    {"MetricName": name, "Value": value, "Unit": unit}
+                    for name, value, unit in items[start : start + _MAX_METRIC_DATA_PER_CALL]
+                ],
+            )
+
+    def put_property(self, name: str, value: str) -> None:
+        self.put_metric(name=name, value=1.0, unit="Count")
+
+
+@dataclass
+class MetricsBatcher:
+    """Buffers metrics in memory and forwards them to ``sink`` in batches.
+
+    A background thread sends a batch once ``max_batch_size`` items are
+    buffered or ``flush_interval_seconds`` after the first buffered item,
+    whichever comes first, so callers only pay for a list append and never
+    wait on ``PutMetricData``.
+    """
+
+    sink: CloudWatchMetricSink
+    flush_interval_seconds: float = 0.25
+    max_batch_size: int = 100
+    _buffer: List[MetricItem] = field(default_factory=list, init=False, repr=False)
+    _condition: threading.Condition = field(default_factory=threading.Condition, init=False, repr=False)
+    _flusher: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+    _stopped: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+
+    def put_metric(self, name: str, value: float, unit: str = "Count") -> None:
+        self.put_metrics([(name, value, unit)])
+
     def put_property(self, name: str, value: str) -> None:
         self.put_metric(name=name, value=1.0, unit="Count")
 
+    def put_metrics(self, items: Sequence[MetricItem]) -> None:
+        with self._condition:
+            was_empty = not self._buffer
+            self._buffer.extend(items)
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run, name="metrics-batcher", daemon=True
+                )
+                self._flusher.start()
+            # Wake the flusher to start a batch window or to send a full batch.
+            if was_empty or len(self._buffer) >= self.max_batch_size:
+                self._condition.notify()
+
+    def flush(self) -> None:
+        """Send everything buffered so far from the calling thread."""
+
+        with self._condition:
+            batch = self._drain()
+        if batch:
+            self._send(batch)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the flusher, wait for its in-flight batch, then send what is left."""
+
+        with self._condition:
+            self._stopped.set()
+            self._condition.notify()
+            flusher = self._flusher
+        if flusher is not None:
+            flusher.join(timeout)
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            with self._condition:
+                while not self._buffer and not self._stopped.is_set():
+                    self._condition.wait()
+                deadline = time.monotonic() + self.flush_interval_seconds
+                while len(self._buffer) < self.max_batch_size and not self._stopped.is_set():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = self._drain()
+            if batch:
+                self._send(batch)
+
+    def _drain(self) -> List[MetricItem]:
+        batch, self._buffer = self._buffer, []
+        return batch
+
+    def _send(self, batch: List[MetricItem]) -> None:
+        try:
+            self.sink.put_metrics(batch)
+        except Exception:
+            logger.warning("Dropped %d metrics after PutMetricData failed", len(batch), exc_info=True)
+
 
 @dataclass
 class FeedbackCollector:
     """Persists human feedback for later review."""
 
     table_name: str
-    client: any = field(default_factory=lambda: boto3.client("dynamodb"))
+    client: any = field(default_factory=lambda: boto3.client("dynamodb", config=SHARED_CLIENT_CONFIG))
+    epoch_millis_timestamps: bool = False
+
+    def _timestamp(self) -> Dict[str, str]:
+        """Return the ``timestamp`` attribute as ISO-8601 or, when opted in, epoch milliseconds."""
+
+        if self.epoch_millis_timestamps:
+            return {"N": str(time.time_ns() // 1_000_000)}
+        return {"S": datetime.now(timezone.utc).isoformat()}
 
     def record_feedback(self, conversation_id: str, rating: str, notes: str) -> None:
         self.client.put_item(
@@ -51,7 +165,7 @@ class FeedbackCollector:
                 "conversationId": {"S": conversation_id},
                 "rating": {"S": rating},
                 "notes": {"S": notes},
-                "timestamp": {"S": datetime.utcnow().isoformat()},
+                "timestamp": self._timestamp(),
             },
         )
 
@@ -65,9 +179,13 @@ class ObservabilityManager:
     feedback_collector: FeedbackCollector | None = None
 
     def emit_metrics(self, metrics: Dict[str, float]) -> None:
-        for name, value in metrics.items():
-            for sink in self.sinks:
-                sink.put_metric(name, value)
+        items: List[MetricItem] = [(name, value, "Count") for name, value in metrics.items()]
+        for sink in self.sinks:
+            if hasattr(sink, "put_metrics"):
+                sink.put_metrics(items)
+                continue
+            for name, value, unit in items:
+                sink.put_metric(name, value, unit)
 
     def add_properties(self, props: Dict[str, str]) -> None:
         for name, value in props.items():
@@ -88,11 +206,16 @@ def create_observability_manager(config: AgentCoreConfig) -> ObservabilityManage
 
     sinks: List[MetricSink] = []
     if obs_config.enable_cloudwatch_metrics:
-        sinks.append(CloudWatchMetricSink(namespace=obs_config.namespace))
+        batcher = MetricsBatcher(sink=CloudWatchMetricSink(namespace=obs_config.namespace))
+        atexit.register(batcher.close)
+        sinks.append(batcher)
 
     feedback_collector = None
     if obs_config.feedback_table_name:
-        feedback_collector = FeedbackCollector(table_name=obs_config.feedback_table_name)
+        feedback_collector = FeedbackCollector(
+            table_name=obs_config.feedback_table_name,
+            epoch_millis_timestamps=obs_config.feedback_epoch_millis_timestamps,
+        )
 
     return ObservabilityManager(
         config=config,
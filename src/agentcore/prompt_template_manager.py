@@ -1,14 +1,86 @@
 """Prompt template utilities that leverage Bedrock Prompt Management."""
 from __future__ import annotations
 
+import logging
+import random
+import threading
+import time
 from dataclasses import dataclass
-from typing import Dict
+from typing import Any, Dict, Optional, Set, Tuple
 
 from .bedrock_clients import BedrockClientFactory
 from .config import PromptTemplateConfig
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# GetPrompt responses keyed by (region, prompt_arn, version), stored as (expires_at, response).
+_PROMPT_RESPONSES: Dict[Tuple[str, str, Optional[str]], Tuple[float, Dict[str, Any]]] = {}
+_PROMPT_RESPONSES_LOCK = threading.Lock()
+# Keys with a GetPrompt call in flight; other callers keep serving the stale response.
+_PROMPT_REFRESHING: Set[Tuple[str, str, Optional[str]]] = set()
+_PROMPT_RETRY_SECONDS = 30.0
+
+
+def _prompt_key(client, prompt_arn: str, version: Optional[str]) -> Tuple[str, str, Optional[str]]:
+    # ``None`` and ``"$LATEST"`` both select the unversioned prompt.
+    return (client.meta.region_name, prompt_arn, None if version == "$LATEST" else version)
+
+
+def peek_prompt_cached(client, prompt_arn: str, version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Return the cached ``GetPrompt`` response if it has not expired, without fetching."""
+
+    entry = _PROMPT_RESPONSES.get(_prompt_key(client, prompt_arn, version))
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def get_prompt_cached(
+    client,
+    prompt_arn: str,
+    version: Optional[str] = None,
+    ttl_seconds: float = 300.0,
+) -> Dict[str, Any]:
+    """Return the ``GetPrompt`` response for ``prompt_arn`` from the process-wide cache.
+
+    Entries are keyed by region, prompt ARN and version so the deployer and
+    every runtime service share one control-plane round trip, and are refetched
+    ``ttl_seconds`` after they were fetched. Once an entry expires a single
+    caller refreshes it while everyone else keeps getting the stale response.
+    If a refresh fails the stale response is served and the next attempt is
+    pushed back by a jittered delay.
+    """
+
+    key = _prompt_key(client, prompt_arn, version)
+    with _PROMPT_RESPONSES_LOCK:
+        entry = _PROMPT_RESPONSES.get(key)
+        if entry is not None and (entry[0] > time.monotonic() or key in _PROMPT_REFRESHING):
+            return entry[1]
+        _PROMPT_REFRESHING.add(key)
+
+    # The lock only guards the dict; lookups for unrelated prompts must not
+    # wait on this network call.
+    params = {"promptIdentifier": prompt_arn}
+    if key[2]:
+        params["promptVersion"] = key[2]
+    try:
+        response = client.get_prompt(**params)
+        expires_at = time.monotonic() + ttl_seconds
+    except Exception:
+        if entry is None:
+            with _PROMPT_RESPONSES_LOCK:
+                _PROMPT_REFRESHING.discard(key)
+            raise
+        logger.warning("Prompt refresh failed for %s; serving cached template", prompt_arn, exc_info=True)
+        response = entry[1]
+        expires_at = time.monotonic() + _PROMPT_RETRY_SECONDS * random.uniform(0.5, 1.5)
+    with _PROMPT_RESPONSES_LOCK:
+        _PROMPT_RESPONSES[key] = (expires_at, response)
+        _PROMPT_REFRESHING.discard(key)
+    return response
+
+
+@dataclass(slots=True)
 class PromptTemplateManager:
     """Downloads prompt templates from Bedrock Prompt Management."""
 
@@ -16,11 +88,26 @@ class PromptTemplateManager:
     config: PromptTemplateConfig
 
     def fetch(self) -> Dict[str, str]:
-        client = self.client_factory.bedrock_agent()
-        params = {"promptIdentifier": self.config.prompt_arn}
-        if self.config.version:
-            params["promptVersion"] = self.config.version
-        response = client.get_prompt(**params)
+        response = get_prompt_cached(
+            self.client_factory.bedrock_agent(),
+            self.config.prompt_arn,
+            self.config.version,
+            self.config.cache_ttl_seconds,
+        )
+        return self._to_metadata(response)
+
+    def cached(self) -> Optional[Dict[str, str]]:
+        """Return prompt metadata only if an unexpired copy is already cached."""
+
+        response = peek_prompt_cached(
+            self.client_factory.bedrock_agent(),
+            self.config.prompt_arn,
+            self.config.version,
+        )
+        return self._to_metadata(response) if response is not None else None
+
+    @staticmethod
+    def _to_metadata(response: Dict[str, Any]) -> Dict[str, str]:
         return {
             "name": response["name"],
             "template": response["prompt"]
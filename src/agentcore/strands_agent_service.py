@@ -1,15 +1,22 @@
 """Strands Agent runtime helpers used by the Chainlit frontend."""
 from __future__ import annotations
 
+import hashlib
+import io
+import re
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
-
-from .bedrock_clients import BedrockDependencyContainer
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .bedrock_clients import BedrockClientFactory, BedrockDependencyContainer
+from .cache import TTLCache
 from .config import AgentCoreConfig
 from .guardrail_manager import GuardrailApplicationResult, GuardrailManager
 from .knowledge_base import KnowledgeBaseRetriever
-from .mcp_manager import MCPBootstrapper
+from .mcp_manager import MCPBootstrapper, MCPRepositoryInstaller
 from .observability import ObservabilityManager, create_observability_manager
 from .prompt_template_manager import PromptTemplateManager
 
@@ -18,6 +25,12 @@ try:  # pragma: no cover - illustrative import
 except ImportError:  # pragma: no cover - fallback for documentation
     AgentCoreRuntime = object  # type: ignore
 
+_PREPARE_CACHE_SIZE = 512
+_PREPARE_CACHE_TTL_SECONDS = 300.0
+
+# "mcp" also covers "mcp://"; one case-insensitive pass replaces lower() plus substring scans.
+_MCP_KEYWORDS = re.compile(r"mcp|model context protocol", re.IGNORECASE)
+
 
 @dataclass(frozen=True)
 class AgentResponseMetrics:
@@ -38,7 +51,7 @@ class AgentResponse:
     """Represents the processed output returned to the caller."""
 
     text: str
-    citations: List[str]
+    citations: Tuple[str, ...]
     metrics: AgentResponseMetrics
     guardrail_action: Optional[str] = None
     guardrail_reason: Optional[str] = None
@@ -52,27 +65,24 @@ class PreparedAgentRequest:
     input_text: str
     prompt: str
     session_state: Dict[str, Any]
-    citations: List[str]
+    citations: Tuple[str, ...]
 
     def runtime_parameters(
         self,
-        config: AgentCoreConfig,
+        base_params: Mapping[str, Any],
         conversation_id: str,
-        guardrail_params: Dict[str, str],
     ) -> Dict[str, Any]:
-        params: Dict[str, Any] = {
-            "agentId": config.bedrock_agent_id,
-            "agentAliasId": config.bedrock_agent_alias_id,
+        """Merge the per-request fields into the service's invariant parameters."""
+
+        return {
+            **base_params,
             "sessionId": conversation_id,
-            "endSession": False,
             "inputText": self.input_text,
             "sessionState": self.session_state,
         }
-        params.update(guardrail_params)
-        return params
 
 
-@dataclass
+@dataclass(slots=True)
 class StrandsAgentService:
     """Coordinates request flow across Bedrock and Strands components."""
 
@@ -83,10 +93,27 @@ class StrandsAgentService:
     knowledge_retriever: KnowledgeBaseRetriever
     observability: ObservabilityManager | None
     mcp_bootstrapper: MCPBootstrapper
+    _client_factory: BedrockClientFactory = field(init=False, repr=False)
+    _runtime_client: Any = field(init=False, repr=False)
+    _base_params: Mapping[str, Any] = field(init=False, repr=False)
+    _agent_runtime: AgentCoreRuntime = field(init=False, repr=False)
+    _prepare_cache: TTLCache = field(init=False, repr=False)
+    _io_pool: ThreadPoolExecutor = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self._prompt_cache: Dict[str, str] | None = None
         self._client_factory = self.dependencies.factory()
+        self._runtime_client = self._client_factory.bedrock_agent_runtime()
+        # Read-only so the shared base cannot be mutated by a single request.
+        self._base_params = MappingProxyType(
+            {
+                "agentId": self.config.bedrock_agent_id,
+                "agentAliasId": self.config.bedrock_agent_alias_id,
+                "endSession": False,
+                **self.guardrail_manager.runtime_parameters(),
+            }
+        )
+        self._prepare_cache = TTLCache(maxsize=_PREPARE_CACHE_SIZE, ttl_seconds=_PREPARE_CACHE_TTL_SECONDS)
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="strands-prepare")
         self._agent_runtime = self._create_agent_runtime()
 
     def _create_agent_runtime(self) -> AgentCoreRuntime:
@@ -100,14 +127,43 @@ class StrandsAgentService:
         return runtime
 
     def _load_prompt(self) -> Dict[str, str]:
-        if not self._prompt_cache:
-            self._prompt_cache = self.prompt_manager.fetch()
-        return self._prompt_cache
+        return self.prompt_manager.fetch()
+
+    def _prepare_cache_key(self, user_input: str) -> Tuple[str, Optional[str], str, bytes]:
+        prompt_config = self.prompt_manager.config
+        return (
+            prompt_config.prompt_arn,
+            prompt_config.version,
+            self.config.knowledge_base.knowledge_base_id,
+            hashlib.blake2b(user_input.encode("utf-8"), digest_size=16).digest(),
+        )
 
     def prepare(self, user_input: str) -> PreparedAgentRequest:
-        prompt_metadata = self._load_prompt()
-        retrieved_docs = self.knowledge_retriever.retrieve(user_input)
-        citations = self.knowledge_retriever.to_citations(retrieved_docs)
+        """Build the runtime payload, reusing recent results for repeated questions.
+
+        Cached requests are discarded when the prompt template has changed so a
+        refreshed prompt is never paired with stale retrieval results.
+        """
+
+        cache_key = self._prepare_cache_key(user_input)
+        cached = self._prepare_cache.get(cache_key)
+        if cached is not None:
+            prompt_metadata = self._load_prompt()
+            if cached.prompt == prompt_metadata["template"]:
+                return cached
+            retrieved_docs = self.knowledge_retriever.retrieve(user_input)
+        else:
+            prompt_metadata = self.prompt_manager.cached()
+            if prompt_metadata is not None:
+                retrieved_docs = self.knowledge_retriever.retrieve(user_input)
+            else:
+                # Retrieval and a cold or expired prompt fetch are independent
+                # round trips, so they overlap instead of running back to back.
+                prompt_future = self._io_pool.submit(self._load_prompt)
+                retrieved_docs = self.knowledge_retriever.retrieve(user_input)
+                prompt_metadata = prompt_future.result()
+
+        citations = tuple(self.knowledge_retriever.to_citations(retrieved_docs))
 
         kb_config = {
             "knowledgeBaseId": self.config.knowledge_base.knowledge_base_id,
@@ -123,26 +179,26 @@ class StrandsAgentService:
             }
         }
 
-        return PreparedAgentRequest(
+        prepared = PreparedAgentRequest(
             input_text=user_input,
             prompt=prompt_metadata["template"],
             session_state=session_state,
             citations=citations,
         )
+        self._prepare_cache.set(cache_key, prepared)
+        return prepared
 
     def complete(self, conversation_id: str, prepared: PreparedAgentRequest) -> AgentResponse:
-        start_time = time.perf_counter()
-        runtime_client = self._client_factory.bedrock_agent_runtime()
+        start_ns = time.monotonic_ns()
         params = prepared.runtime_parameters(
-            config=self.config,
+            base_params=self._base_params,
             conversation_id=conversation_id,
-            guardrail_params=self.guardrail_manager.runtime_parameters(),
         )
-        stream = runtime_client.invoke_agent(**params)
+        stream = self._runtime_client.invoke_agent(**params)
 
         response_text, total_tokens, used_mcp = self._collect_response(stream)
-        elapsed = time.perf_counter() - start_time
-        metrics = AgentResponseMetrics(latency_seconds=elapsed, output_tokens=total_tokens)
+        latency_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+        metrics = AgentResponseMetrics(latency_seconds=latency_ms / 1000.0, output_tokens=total_tokens)
 
         guardrail_result: Optional[GuardrailApplicationResult] = None
         if used_mcp and response_text:
@@ -155,7 +211,7 @@ class StrandsAgentService:
         if self.observability:
             self.observability.emit_metrics(
                 {
-                    "LatencyMs": metrics.latency_seconds * 1000,
+                    "LatencyMs": float(latency_ms),
                     "OutputTokens": float(metrics.output_tokens),
                 }
             )
@@ -176,56 +232,87 @@ class StrandsAgentService:
 
     @staticmethod
     def _collect_response(stream: Dict[str, Any]) -> tuple[str, int, bool]:
-        response_chunks: List[str] = []
+        """Assemble the completion text, token count and MCP usage in one pass.
+
+        Trace events streamed alongside the completion are checked while the
+        text is collected; the separate ``trace`` list is only walked when no
+        interleaved event already showed MCP usage.
+        """
+
+        trace_event_uses_mcp = StrandsAgentService._trace_event_uses_mcp
+        # Most answers arrive as a single chunk, so the buffer is only created
+        # once a second chunk shows up.
+        first_chunk = ""
+        buffer: Optional[io.StringIO] = None
         total_tokens = 0
-        for event in stream.get("completion", []):
-            chunk = event.get("delta", {}).get("text", "")
-            if chunk:
-                response_chunks.append(chunk)
-            metrics = event.get("metrics", {})
+        used_mcp = False
+        for event in stream.get("completion", ()):
+            if not used_mcp and "trace" in event:
+                used_mcp = trace_event_uses_mcp(event)
+            metrics = event.get("metrics")
             if metrics:
                 total_tokens += int(metrics.get("outputTokens", 0))
-        used_mcp = StrandsAgentService._detect_mcp_usage(stream)
-        return "".join(response_chunks), total_tokens, used_mcp
+            delta = event.get("delta")
+            chunk = delta.get("text", "") if delta else ""
+            if not chunk:
+                continue
+            if buffer is not None:
+                buffer.write(chunk)
+            elif not first_chunk:
+                first_chunk = chunk
+            else:
+                buffer = io.StringIO()
+                buffer.write(first_chunk)
+                buffer.write(chunk)
+        if not used_mcp:
+            used_mcp = StrandsAgentService._detect_mcp_usage(stream)
+        response_text = buffer.getvalue() if buffer is not None else first_chunk
+        return response_text, total_tokens, used_mcp
 
     @staticmethod
-    def _contains_keyword(payload: Any, keywords: set[str]) -> bool:
-        if isinstance(payload, str):
-            lowered = payload.lower()
-            return any(keyword in lowered for keyword in keywords)
-        if isinstance(payload, dict):
-            return any(
-                StrandsAgentService._contains_keyword(key, keywords)
-                or StrandsAgentService._contains_keyword(value, keywords)
-                for key, value in payload.items()
-            )
-        if isinstance(payload, list):
-            return any(StrandsAgentService._contains_keyword(item, keywords) for item in payload)
+    def _contains_keyword(payload: Any) -> bool:
+        """Return ``True`` when any string nested in ``payload`` mentions MCP."""
+
+        search = _MCP_KEYWORDS.search
+        pending = [payload]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, str):
+                if search(node):
+                    return True
+            elif isinstance(node, dict):
+                pending.extend(node.keys())
+                pending.extend(node.values())
+            elif isinstance(node, list):
+                pending.extend(node)
         return False
 
+    @staticmethod
+    def _trace_event_uses_mcp(event: Any) -> bool:
+        if not isinstance(event, dict):
+            return False
+        detail = event.get("trace", event)
+        if isinstance(detail, dict):
+            type_hint = str(detail.get("type", "")).upper()
+            if type_hint in {"ACTION_GROUP", "TOOL", "MCP"}:
+                return True
+            provider = detail.get("provider")
+            if isinstance(provider, str) and "mcp" in provider.lower():
+                return True
+            metadata = detail.get("observationMetadata") or detail.get("metadata")
+            if StrandsAgentService._contains_keyword(metadata):
+                return True
+        return StrandsAgentService._contains_keyword(event)
+
     @staticmethod
     def _detect_mcp_usage(stream: Dict[str, Any]) -> bool:
-        """Detect whether the agent trace includes MCP sourced content."""
+        """Detect whether the agent trace includes MCP sourced content.
 
-        keywords = {"mcp://", "model context protocol", "mcp"}
-        trace_events = stream.get("trace", [])
-        for event in trace_events:
-            if not isinstance(event, dict):
-                continue
-            detail = event.get("trace", event)
-            if isinstance(detail, dict):
-                type_hint = str(detail.get("type", "")).upper()
-                if type_hint in {"ACTION_GROUP", "TOOL", "MCP"}:
-                    return True
-                provider = detail.get("provider")
-                if isinstance(provider, str) and "mcp" in provider.lower():
-                    return True
-                metadata = detail.get("observationMetadata") or detail.get("metadata")
-                if StrandsAgentService._contains_keyword(metadata, keywords):
-                    return True
-            if StrandsAgentService._contains_keyword(event, keywords):
-                return True
-        return StrandsAgentService._contains_keyword(stream, keywords)
+        Only trace events are inspected; completion text is not scanned, so an
+        answer that merely mentions MCP does not count as MCP usage.
+        """
+
+        return any(StrandsAgentService._trace_event_uses_mcp(event) for event in stream.get("trace", ()))
 
     @classmethod
     def create(cls, dependencies: BedrockDependencyContainer, install_dir: str = "/opt/mcp") -> "StrandsAgentService":
@@ -244,9 +331,6 @@ class StrandsAgentService:
             config=config.knowledge_base,
         )
         observability = create_observability_manager(config)
-        from pathlib import Path
-        from .mcp_manager import MCPRepositoryInstaller
-
         installer = MCPRepositoryInstaller(
             repositories=config.mcp_repositories,
             install_dir=Path(install_dir),
@@ -1,12 +1,13 @@
 """Chainlit application entry point deployed on ECS."""
 from __future__ import annotations
 
-import json
+import functools
 import os
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import uuid4
 
 import chainlit as cl
+import orjson
 
 from agentcore.bedrock_clients import BedrockDependencyContainer
 from agentcore.strands_agent_service import AgentResponse, StrandsAgentService
@@ -14,15 +15,28 @@ from agentcore.strands_agent_service import AgentResponse, StrandsAgentService
 from .config_loader import EnvironmentLoader
 
 
-def _format_citations(citations: list[str]) -> str:
+def _pretty(payload: object) -> str:
+    """Render ``payload`` as indented JSON for Chainlit step output."""
+
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+
+
+def _format_citations(citations: Sequence[str]) -> str:
     if not citations:
         return "No citations returned by the knowledge base."
     joined = "\n".join(f"- {citation}" for citation in citations)
     return f"**Sources**\n{joined}"
 
 
-@cl.on_chat_start
-async def on_chat_start() -> None:
+@functools.lru_cache(maxsize=1)
+def _shared_service() -> StrandsAgentService:
+    """Build the process-wide agent service on first use.
+
+    Creating the service installs MCP repositories and builds boto3 clients, so
+    it is done once per container rather than for every chat session. The
+    service and its clients are safe to share across sessions.
+    """
+
     loader = EnvironmentLoader()
     bundle = loader.bundle()
     region = os.environ.get("AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1"))
@@ -31,8 +45,12 @@ async def on_chat_start() -> None:
         config=bundle.agent_core,
         region_name=region,
     )
-    service = StrandsAgentService.create(dependencies)
-    cl.user_session.set("service", service)
+    return StrandsAgentService.create(dependencies)
+
+
+@cl.on_chat_start
+async def on_chat_start() -> None:
+    cl.user_session.set("service", _shared_service())
     cl.user_session.set("conversation_id", str(uuid4()))
 
     await cl.Message(
@@ -57,7 +75,7 @@ async def on_message(message: cl.Message) -> None:
             "promptPreview": prepared.prompt[:160],
             "references": prepared.citations,
         }
-        retrieve_step.output = json.dumps(preview, indent=2)
+        retrieve_step.output = _pretty(preview)
 
     async with cl.Step(name="Invoke Bedrock AgentCore via Strands") as invoke_step:
         result: AgentResponse = await cl.make_async(service.complete)(conversation_id, prepared)
@@ -68,7 +86,7 @@ async def on_message(message: cl.Message) -> None:
             metrics_payload["guardrailReason"] = result.guardrail_reason
         if result.guardrail_metadata:
             metrics_payload["guardrailMetadata"] = result.guardrail_metadata
-        invoke_step.output = json.dumps(metrics_payload, indent=2)
+        invoke_step.output = _pretty(metrics_payload)
 
     final_step = cl.Step(name="Final agent response")
     async with final_step:
@@ -103,7 +121,7 @@ async def on_feedback(action: cl.Action) -> None:
         return
 
     service.observability.record_feedback(
-        conversation_id=pending.get("conversation_id", str(uuid4())),
+        conversation_id=pending.get("conversation_id") or "unknown-session",
         rating=action.value,
         notes="collected-via-chainlit",
     )
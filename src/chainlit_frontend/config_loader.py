@@ -45,6 +45,8 @@ class EnvironmentLoader:
             enable_cloudwatch_metrics=True,
             enable_cloudwatch_logs=True,
             feedback_table_name=os.environ.get("FEEDBACK_TABLE"),
+            feedback_epoch_millis_timestamps=os.environ.get("FEEDBACK_TIMESTAMP_EPOCH_MS", "").lower()
+            in {"1", "true", "yes"},
         )
         agent_core = AgentCoreConfig(
             bedrock_agent_id=os.environ["BEDROCK_AGENT_ID"],
@@ -56,6 +58,7 @@ class EnvironmentLoader:
             prompt_template=PromptTemplateConfig(
                 prompt_arn=os.environ["PROMPT_ARN"],
                 version=os.environ.get("PROMPT_VERSION"),
+                cache_ttl_seconds=float(os.environ.get("PROMPT_CACHE_TTL_SECONDS", "300")),
             ),
             guardrail=GuardrailConfig(
                 guardrail_arn=os.environ["GUARDRAIL_ARN"],